@@ -108,17 +108,16 @@ def _clean_response_text(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _create_metadata(df: pl.DataFrame) -> pl.Expr:
-    """Create metadata JSON structure."""
-    return (
-        pl.struct([
-            pl.col("document").alias("sdg_document"),
-            pl.lit("document_knowledge_qa").alias("dataset"),
-            pl.col("raw_document"),
-        ])
-        .map_elements(json.dumps)
-        .alias("metadata")
-    )
+def _create_metadata(df: pl.DataFrame, serialize: bool = True) -> pl.Expr:
+    """Create metadata structure, serialized to a JSON string by default."""
+    metadata = pl.struct([
+        pl.col("document").alias("sdg_document"),
+        pl.lit("document_knowledge_qa").alias("dataset"),
+        pl.col("raw_document"),
+    ])
+    if serialize:
+        metadata = metadata.map_elements(json.dumps, return_dtype=pl.String)
+    return metadata.alias("metadata")
 
 
 def _create_messages_with_reasoning(record: dict) -> List[dict]:
@@ -183,6 +182,7 @@ def generate_knowledge_qa_dataset(
     pre_training: bool = False,
     dataset_name: str = "document_knowledge_qa",
     keep_document_in_context: bool = False,
+    serialize_metadata: bool = True,
 ) -> pl.DataFrame:
     """
     Generate knowledge Q&A dataset in chat format.
@@ -192,6 +192,9 @@ def generate_knowledge_qa_dataset(
         keep_columns: Additional columns to keep in output
         pre_training: Whether to add unmask column for pre-training
         dataset_name: Name for the dataset metadata
+        keep_document_in_context: Whether to include the document in the user message
+        serialize_metadata: Store metadata as a JSON string (default) or, if False,
+            as a Polars struct column that needs no per-row JSON parsing
 
     Returns:
         Formatted dataset with messages and metadata
@@ -217,7 +220,7 @@ def generate_knowledge_qa_dataset(
     generated_dataset = _clean_response_text(generated_dataset)
 
     # Create base columns
-    base_columns = [_create_metadata(generated_dataset)]
+    base_columns = [_create_metadata(generated_dataset, serialize=serialize_metadata)]
 
     # Handle reasoning column
     has_reasoning = "reasoning" in generated_dataset.columns
@@ -1,8 +1,13 @@
 """Shared test fixtures and utilities for all tests."""
 
+import json
+import os
+from fnmatch import fnmatch
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
+from nbformat import reads
 
 # Try to import tomllib (Python 3.11+) or fall back to tomli
 try:
@@ -13,18 +18,70 @@ except ImportError:
     except ImportError:
         tomllib = None
 
+# Prefer orjson for notebook JSON (parses bytes directly), fall back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when possible, otherwise with the stdlib.
+
+    orjson rejects the NaN/Infinity literals that nbformat writes and Jupyter
+    reads, so documents it refuses are re-parsed with ``json.loads``; only
+    the stdlib's verdict decides whether a notebook is invalid.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _find_example_files(repo_root, pattern):
+    """Find files under examples/, skipping hidden and checkpoint directories."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(repo_root / "examples"):
+        # Prune in place so os.walk skips .ipynb_checkpoints, .venv, etc.
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        found.extend(Path(dirpath, f) for f in sorted(filenames) if fnmatch(f, pattern))
+    return found
+
 
 def pytest_configure(config):
-    """Configure pytest with custom data."""
+    """Configure pytest with custom data.
+
+    Example files are discovered once here and stored as tuples; the
+    all_notebooks and all_pyproject_files fixtures reuse the same results.
+    """
     repo_root = Path(__file__).parent.parent
-    notebooks = list(repo_root.glob("examples/**/*.ipynb"))
-    config._notebooks = [(nb, nb.relative_to(repo_root)) for nb in notebooks]
+    notebooks = _find_example_files(repo_root, "*.ipynb")
+    config._notebooks = tuple((nb, nb.relative_to(repo_root)) for nb in notebooks)
 
-    pyproject_files = list(repo_root.glob("examples/**/pyproject.toml"))
+    pyproject_files = _find_example_files(repo_root, "pyproject.toml")
     root_pyproject = repo_root / "pyproject.toml"
     if root_pyproject.exists():
         pyproject_files.insert(0, root_pyproject)
-    config._pyproject_files = pyproject_files
+    config._pyproject_files = tuple(pyproject_files)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep all tests for one notebook on the same xdist worker.
+
+    With ``--dist loadgroup`` each notebook is then parsed once per session
+    by the worker that owns it, instead of once per worker. Runs first so the
+    marks exist before xdist's own hook turns them into ``@group`` node ids.
+    """
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "relative_path" in callspec.params:
+            group = str(callspec.params["relative_path"])
+            item.add_marker(pytest.mark.xdist_group(name=group))
 
 
 @pytest.fixture(scope="session")
@@ -34,20 +91,83 @@ def repo_root():
 
 
 @pytest.fixture(scope="session")
-def all_notebooks(repo_root):
+def all_notebooks(pytestconfig):
     """Get all notebooks in examples directory."""
-    notebooks = list(repo_root.glob("examples/**/*.ipynb"))
-    return [(nb, nb.relative_to(repo_root)) for nb in notebooks]
+    return pytestconfig._notebooks
 
 
 @pytest.fixture(scope="session")
-def all_pyproject_files(repo_root):
+def all_pyproject_files(pytestconfig):
     """Get all pyproject.toml files in repository."""
-    pyproject_files = list(repo_root.glob("examples/**/pyproject.toml"))
-    root_pyproject = repo_root / "pyproject.toml"
-    if root_pyproject.exists():
-        pyproject_files.insert(0, root_pyproject)
-    return pyproject_files
+    return pytestconfig._pyproject_files
+
+
+@pytest.fixture(scope="session")
+def notebook_cache():
+    """Memoize per-notebook values for the whole session.
+
+    Returns ``cached(kind, path, build)``, which calls ``build()`` the first
+    time a ``kind`` of value is requested for a notebook and reuses it after.
+    """
+    cache = {}
+
+    def cached(kind, path, build):
+        key = (kind, path)
+        if key not in cache:
+            cache[key] = build()
+        return cache[key]
+
+    return cached
+
+
+@pytest.fixture
+def notebook_bytes(notebook_path, notebook_cache):
+    """Get the raw bytes of the notebook, reading each file once per session."""
+    return notebook_cache("bytes", notebook_path, notebook_path.read_bytes)
+
+
+@pytest.fixture(scope="session")
+def parse_notebook(notebook_cache, json_parser):
+    """Get a function returning a notebook's JSON dict, parsed once per session."""
+
+    def parse(path):
+        raw = notebook_cache("bytes", path, path.read_bytes)
+        return notebook_cache("json", path, lambda: json_parser.loads(raw))
+
+    return parse
+
+
+@pytest.fixture
+def parsed_notebook(notebook_path, parse_notebook):
+    """Get the notebook as a plain JSON dict, parsing each file once per session."""
+    return parse_notebook(notebook_path)
+
+
+@pytest.fixture
+def notebook_node(notebook_path, relative_path, notebook_bytes, notebook_cache):
+    """Get the nbformat-parsed notebook, parsing each file once per session."""
+
+    def read_node():
+        try:
+            return reads(notebook_bytes.decode("utf-8"), as_version=4)
+        except Exception as e:
+            pytest.fail(f"Error reading notebook {relative_path}: {e}")
+
+    return notebook_cache("node", notebook_path, read_node)
+
+
+@pytest.fixture
+def code_cell_sources(notebook_path, notebook_node, notebook_cache):
+    """Get (cell index, source) pairs for every code cell in the notebook."""
+    return notebook_cache(
+        "code_cell_sources",
+        notebook_path,
+        lambda: tuple(
+            (i, cell.source)
+            for i, cell in enumerate(notebook_node.cells)
+            if cell.cell_type == "code"
+        ),
+    )
 
 
 @pytest.fixture(scope="session")
@@ -66,3 +186,9 @@ def toml_parser():
     if tomllib is None:
         pytest.skip("No TOML parser available (need tomllib or tomli)")
     return tomllib
+
+
+@pytest.fixture(scope="session")
+def json_parser():
+    """Get JSON parser (orjson if available, falling back to json)."""
+    return SimpleNamespace(loads=_json_loads)
@@ -1,10 +1,26 @@
 """Pytest configuration and fixtures for knowledge-tuning tests."""
 
 import json
+import sys
+from functools import partial
 from pathlib import Path
 
+import polars as pl
 import pytest
 
+from .mocks.transformers_mock import MockTokenizer
+
+# Make knowledge_utils importable by the utility tests; insert the path only once
+KNOWLEDGE_UTILS_PATH = str(
+    Path(__file__).parents[3]
+    / "examples"
+    / "knowledge-tuning"
+    / "04_Knowledge_Mixing"
+    / "utils"
+)
+if KNOWLEDGE_UTILS_PATH not in sys.path:
+    sys.path.insert(0, KNOWLEDGE_UTILS_PATH)
+
 
 @pytest.fixture
 def notebook_files(knowledge_tuning_path):
@@ -20,13 +36,39 @@ def pyproject_files(knowledge_tuning_path):
     return sorted(pyprojects)
 
 
-def load_notebook(path: Path) -> dict:
+def load_notebook(path: Path, json_parser=json) -> dict:
     """Load a notebook file and return its content as dict."""
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return json_parser.loads(Path(path).read_bytes())
 
 
 @pytest.fixture
-def notebook_loader():
+def notebook_loader(json_parser):
     """Return a function to load notebook files."""
-    return load_notebook
+    return partial(load_notebook, json_parser=json_parser)
+
+
+@pytest.fixture(scope="session")
+def sample_qa_dataframe():
+    """Single-row Q&A dataframe with all columns required by knowledge_utils.
+
+    Polars frames are immutable, so one instance is shared by every test.
+    """
+    return pl.DataFrame({
+        "question": ["q1"],
+        "response": ["r1"],
+        "document": ["doc1"],
+        "document_outline": ["outline1"],
+        "raw_document": ["raw1"],
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_qa_dataframe_with_reasoning(sample_qa_dataframe):
+    """Single-row Q&A dataframe with an added reasoning column."""
+    return sample_qa_dataframe.with_columns(pl.lit("reason1").alias("reasoning"))
+
+
+@pytest.fixture(scope="session")
+def mock_tokenizer():
+    """Shared mock tokenizer; MockTokenizer keeps no per-call state."""
+    return MockTokenizer()
@@ -1,21 +1,14 @@
 """Tests for utility functions in knowledge-tuning."""
 
-import json
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock
-
 import polars as pl
 import pytest
 
-# Add the knowledge-tuning utils to path
-repo_root = Path(__file__).parent.parent.parent.parent
-utils_path = (
-    repo_root / "examples" / "knowledge-tuning" / "04_Knowledge_Mixing" / "utils"
-)
-sys.path.insert(0, str(utils_path))
-
-from knowledge_utils import (  # noqa: E402
+# knowledge_utils is put on sys.path by this package's conftest.py
+from knowledge_utils import (
+    _create_messages_with_reasoning,
+    _create_messages_with_reasoning_no_document,
+    _create_messages_without_reasoning,
+    _create_messages_without_reasoning_no_document,
     count_len_in_tokens,
     generate_knowledge_qa_dataset,
     get_avg_summaries_per_raw_doc,
@@ -23,6 +16,18 @@ from knowledge_utils import (  # noqa: E402
 )
 
 
+@pytest.fixture(scope="session")
+def generated_qa_dataset(sample_qa_dataframe):
+    """Knowledge Q&A dataset generated once with default arguments."""
+    return generate_knowledge_qa_dataset(sample_qa_dataframe)
+
+
+@pytest.fixture(scope="session")
+def generated_qa_dataset_pre_training(sample_qa_dataframe):
+    """Knowledge Q&A dataset generated once with pre_training=True."""
+    return generate_knowledge_qa_dataset(sample_qa_dataframe, pre_training=True)
+
+
 class TestGetAvgSummariesPerRawDoc:
     """Test get_avg_summaries_per_raw_doc function."""
 
@@ -115,32 +120,16 @@ class TestGenerateKnowledgeQaDataset:
         with pytest.raises(ValueError, match="Missing required columns"):
             generate_knowledge_qa_dataset(df)
 
-    def test_data_contract_validation(self):
+    def test_data_contract_validation(self, generated_qa_dataset):
         """Test data contract validation."""
-        df = pl.DataFrame({
-            "question": ["q1"],
-            "response": ["r1"],
-            "document": ["doc1"],
-            "document_outline": ["outline1"],
-            "raw_document": ["raw1"],
-        })
-
-        result = generate_knowledge_qa_dataset(df)
+        result = generated_qa_dataset
         assert isinstance(result, pl.DataFrame)
         assert "messages" in result.columns
         assert "metadata" in result.columns
 
-    def test_json_schema_validation(self):
+    def test_json_schema_validation(self, generated_qa_dataset, json_parser):
         """Test that output follows expected JSON schema."""
-        df = pl.DataFrame({
-            "question": ["q1"],
-            "response": ["r1"],
-            "document": ["doc1"],
-            "document_outline": ["outline1"],
-            "raw_document": ["raw1"],
-        })
-
-        result = generate_knowledge_qa_dataset(df)
+        result = generated_qa_dataset
 
         # Check messages structure - extract from Polars Series
         messages_series = result["messages"]
@@ -166,68 +155,93 @@ class TestGenerateKnowledgeQaDataset:
         metadata = metadata_list[0]
         # Metadata should be a JSON string
         assert isinstance(metadata, str)
-        metadata_dict = json.loads(metadata)
+        metadata_dict = json_parser.loads(metadata)
         assert "dataset" in metadata_dict
 
-    def test_with_reasoning(self):
-        """Test function with reasoning column."""
-        df = pl.DataFrame({
-            "question": ["q1"],
-            "response": ["r1"],
-            "document": ["doc1"],
-            "document_outline": ["outline1"],
-            "raw_document": ["raw1"],
-            "reasoning": ["reason1"],
-        })
+    def test_metadata_as_struct(self, sample_qa_dataframe):
+        """Test that metadata can be kept as a struct instead of a JSON string."""
+        result = generate_knowledge_qa_dataset(
+            sample_qa_dataframe, serialize_metadata=False
+        )
 
-        result = generate_knowledge_qa_dataset(df)
+        assert isinstance(result.schema["metadata"], pl.Struct)
+        metadata = result["metadata"][0]
+        assert metadata == {
+            "sdg_document": "doc1",
+            "dataset": "document_knowledge_qa",
+            "raw_document": "raw1",
+        }
+
+    def test_with_reasoning(self, sample_qa_dataframe_with_reasoning):
+        """Test function with reasoning column."""
+        result = generate_knowledge_qa_dataset(sample_qa_dataframe_with_reasoning)
         assert isinstance(result, pl.DataFrame)
         assert "messages" in result.columns
 
-    def test_pre_training_flag(self):
+    def test_pre_training_flag(
+        self, generated_qa_dataset_pre_training, generated_qa_dataset
+    ):
         """Test pre_training flag adds unmask column."""
-        df = pl.DataFrame({
-            "question": ["q1"],
-            "response": ["r1"],
-            "document": ["doc1"],
-            "document_outline": ["outline1"],
-            "raw_document": ["raw1"],
-        })
-
-        result = generate_knowledge_qa_dataset(df, pre_training=True)
+        result = generated_qa_dataset_pre_training
         assert "unmask" in result.columns
         assert result["unmask"][0] is True
 
-        result_no_pretrain = generate_knowledge_qa_dataset(df, pre_training=False)
-        assert result_no_pretrain["unmask"][0] is False
+        # pre_training defaults to False
+        assert generated_qa_dataset["unmask"][0] is False
+
+
+class TestCreateMessages:
+    """Test the message builders used by generate_knowledge_qa_dataset."""
+
+    RECORD = {
+        "question": "q1",
+        "response": "r1",
+        "document": "doc1",
+        "document_outline": "outline1",
+        "reasoning": "reason1",
+    }
+
+    @pytest.mark.parametrize(
+        "create_messages,expected_user_content,expected_thinking",
+        [
+            (_create_messages_with_reasoning, "outline1\ndoc1\n\nq1", "reason1"),
+            (_create_messages_with_reasoning_no_document, "In outline1, q1", "reason1"),
+            (_create_messages_without_reasoning, "outline1\ndoc1\n\nq1", ""),
+            (_create_messages_without_reasoning_no_document, "In outline1, q1", ""),
+        ],
+    )
+    def test_create_messages(
+        self, create_messages, expected_user_content, expected_thinking
+    ):
+        """Test user/assistant message structure for each builder."""
+        user, assistant = create_messages(self.RECORD)
+
+        assert user == {
+            "role": "user",
+            "content": expected_user_content,
+            "thinking": None,
+        }
+        assert assistant == {
+            "role": "assistant",
+            "content": "r1",
+            "thinking": expected_thinking,
+        }
 
 
 class TestCountLenInTokens:
     """Test count_len_in_tokens function."""
 
-    def test_column_validation(self):
+    def test_column_validation(self, mock_tokenizer):
         """Test that function validates column exists."""
         df = pl.DataFrame({
             "wrong_col": ["val1"],
         })
 
-        mock_tokenizer = MagicMock()
-        mock_tokenizer.apply_chat_template = MagicMock(return_value="test")
-        mock_tokenizer.encode = MagicMock(return_value=[1, 2, 3])
-
         with pytest.raises(ValueError, match="Column 'messages' not found"):
             count_len_in_tokens(df, mock_tokenizer)
 
-    def test_mocked_tokenizer(self):
+    def test_mocked_tokenizer(self, mock_tokenizer):
         """Test function with mocked tokenizer."""
-        import sys
-        from pathlib import Path
-
-        # Add mocks to path
-        mocks_path = Path(__file__).parent / "mocks"
-        sys.path.insert(0, str(mocks_path))
-        from transformers_mock import MockTokenizer
-
         df = pl.DataFrame({
             "messages": [
                 [{"role": "user", "content": "test"}],
@@ -235,31 +249,20 @@ class TestCountLenInTokens:
             ],
         })
 
-        mock_tokenizer = MockTokenizer()
         result = count_len_in_tokens(df, mock_tokenizer, column_name="messages")
 
         assert isinstance(result, pl.DataFrame)
         assert "token_length" in result.columns
         assert len(result) == 2
 
-    def test_tokenizer_mock_behavior(self):
+    def test_tokenizer_mock_behavior(self, mock_tokenizer):
         """Test that tokenizer mocks work correctly."""
-        import sys
-        from pathlib import Path
-
-        # Add mocks to path
-        mocks_path = Path(__file__).parent / "mocks"
-        sys.path.insert(0, str(mocks_path))
-        from transformers_mock import MockTokenizer
-
-        tokenizer = MockTokenizer()
-
         # Test encode
-        encoded = tokenizer.encode("test text")
+        encoded = mock_tokenizer.encode("test text")
         assert isinstance(encoded, list)
         assert len(encoded) > 0
 
         # Test apply_chat_template
         messages = [{"role": "user", "content": "test"}]
-        template = tokenizer.apply_chat_template(messages, tokenize=False)
+        template = mock_tokenizer.apply_chat_template(messages, tokenize=False)
         assert isinstance(template, str)
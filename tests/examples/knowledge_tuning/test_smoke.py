@@ -9,11 +9,21 @@ These tests perform basic smoke testing on the knowledge-tuning notebooks:
 5. Ensure consistency across notebooks (Python version, etc.)
 """
 
-import json
-
 import pytest
 from nbformat import read
 
+STEP_DIRS = (
+    "00_Setup",
+    "01_Base_Model_Evaluation",
+    "02_Data_Processing",
+    "03_Knowledge_Generation",
+    "04_Knowledge_Mixing",
+    "05_Model_Training",
+    "06_Evaluation",
+)
+# 00_Setup is documentation only and has no pyproject.toml
+PROJECT_STEP_DIRS = STEP_DIRS[1:]
+
 
 class TestKnowledgeTuningStructure:
     """Test knowledge-tuning example structure."""
@@ -32,34 +42,13 @@ class TestKnowledgeTuningStructure:
         env_example = knowledge_tuning_path / ".env.example"
         assert env_example.exists(), ".env.example not found"
 
-    @pytest.mark.parametrize(
-        "step_dir",
-        [
-            "00_Setup",
-            "01_Base_Model_Evaluation",
-            "02_Data_Processing",
-            "03_Knowledge_Generation",
-            "04_Knowledge_Mixing",
-            "05_Model_Training",
-            "06_Evaluation",
-        ],
-    )
+    @pytest.mark.parametrize("step_dir", STEP_DIRS)
     def test_step_directories_exist(self, knowledge_tuning_path, step_dir):
         """Test that all step directories exist."""
         step_path = knowledge_tuning_path / step_dir
         assert step_path.is_dir(), f"{step_dir} directory not found"
 
-    @pytest.mark.parametrize(
-        "step_dir",
-        [
-            "01_Base_Model_Evaluation",
-            "02_Data_Processing",
-            "03_Knowledge_Generation",
-            "04_Knowledge_Mixing",
-            "05_Model_Training",
-            "06_Evaluation",
-        ],
-    )
+    @pytest.mark.parametrize("step_dir", PROJECT_STEP_DIRS)
     def test_step_has_pyproject_toml(self, knowledge_tuning_path, step_dir):
         """Test that each step has a pyproject.toml file."""
         pyproject = knowledge_tuning_path / step_dir / "pyproject.toml"
@@ -69,7 +58,7 @@ class TestKnowledgeTuningStructure:
 class TestBaseModelEvaluationNotebook:
     """Smoke tests for Base Model Evaluation notebook."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook_path(self, knowledge_tuning_path):
         """Get notebook path."""
         path = (
@@ -80,7 +69,7 @@ class TestBaseModelEvaluationNotebook:
         assert path.exists(), "Base_Model_Evaluation.ipynb not found"
         return path
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook(self, notebook_path):
         """Load the notebook."""
         return read(str(notebook_path), as_version=4)
@@ -135,14 +124,14 @@ class TestBaseModelEvaluationNotebook:
 class TestDataProcessingNotebook:
     """Smoke tests for Data Processing notebook."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook_path(self, knowledge_tuning_path):
         """Get notebook path."""
         path = knowledge_tuning_path / "02_Data_Processing" / "Data_Processing.ipynb"
         assert path.exists(), "Data_Processing.ipynb not found"
         return path
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook(self, notebook_path):
         """Load the notebook."""
         return read(str(notebook_path), as_version=4)
@@ -166,7 +155,7 @@ class TestDataProcessingNotebook:
 class TestKnowledgeGenerationNotebook:
     """Smoke tests for Knowledge Generation notebook."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook_path(self, knowledge_tuning_path):
         """Get notebook path."""
         path = (
@@ -177,7 +166,7 @@ class TestKnowledgeGenerationNotebook:
         assert path.exists(), "Knowledge_Generation.ipynb not found"
         return path
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook(self, notebook_path):
         """Load the notebook."""
         return read(str(notebook_path), as_version=4)
@@ -195,14 +184,14 @@ class TestKnowledgeGenerationNotebook:
 class TestKnowledgeMixingNotebook:
     """Smoke tests for Knowledge Mixing notebook."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook_path(self, knowledge_tuning_path):
         """Get notebook path."""
         path = knowledge_tuning_path / "04_Knowledge_Mixing" / "Knowledge_Mixing.ipynb"
         assert path.exists(), "Knowledge_Mixing.ipynb not found"
         return path
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook(self, notebook_path):
         """Load the notebook."""
         return read(str(notebook_path), as_version=4)
@@ -215,14 +204,14 @@ class TestKnowledgeMixingNotebook:
 class TestModelTrainingNotebook:
     """Smoke tests for Model Training notebook."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook_path(self, knowledge_tuning_path):
         """Get notebook path."""
         path = knowledge_tuning_path / "05_Model_Training" / "Model_Training.ipynb"
         assert path.exists(), "Model_Training.ipynb not found"
         return path
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook(self, notebook_path):
         """Load the notebook."""
         return read(str(notebook_path), as_version=4)
@@ -240,14 +229,14 @@ class TestModelTrainingNotebook:
 class TestEvaluationNotebook:
     """Smoke tests for Evaluation notebook."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook_path(self, knowledge_tuning_path):
         """Get notebook path."""
         path = knowledge_tuning_path / "06_Evaluation" / "Evaluation.ipynb"
         assert path.exists(), "Evaluation.ipynb not found"
         return path
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def notebook(self, notebook_path):
         """Load the notebook."""
         return read(str(notebook_path), as_version=4)
@@ -265,15 +254,14 @@ class TestEvaluationNotebook:
 class TestKnowledgeTuningConsistency:
     """Tests for consistency across knowledge-tuning notebooks."""
 
-    def test_language_info_version_consistency(self, notebook_files):
+    def test_language_info_version_consistency(self, notebook_files, notebook_loader):
         """Ensure language_info.version stays consistent across knowledge-tuning notebooks."""
         if not notebook_files:
             pytest.skip("No notebooks found")
 
         versions = []
         for notebook_path in notebook_files:
-            with open(notebook_path, encoding="utf-8") as f:
-                nb = json.load(f)
+            nb = notebook_loader(notebook_path)
 
             language_info = nb.get("metadata", {}).get("language_info", {})
             version = language_info.get("version")
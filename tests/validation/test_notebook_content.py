@@ -7,9 +7,46 @@ Tests that validate notebook cleanliness and content quality:
 - No empty code cells
 """
 
-import json
+import math
+from typing import NamedTuple
 
 import pytest
+from nbformat import writes
+from nbformat.v4 import new_code_cell, new_notebook
+
+
+class CellScan(NamedTuple):
+    """Content findings collected in a single pass over a notebook's cells."""
+
+    execution_counts: list
+    stored_outputs: list
+    empty_code_cells: list
+
+
+def _scan_cells(nb):
+    """Walk the notebook cells once and collect every content finding."""
+    execution_counts = []
+    stored_outputs = []
+    empty_code_cells = []
+    for i, cell in enumerate(nb.get("cells", ())):
+        execution_count = cell.get("execution_count")
+        if execution_count is not None:
+            execution_counts.append((i, execution_count))
+
+        if cell.get("cell_type") != "code":
+            continue
+
+        # Only look up tags when there are outputs; keep_output cells are exempt
+        outputs = cell.get("outputs")
+        if outputs and "keep_output" not in cell.get("metadata", {}).get("tags", ()):
+            stored_outputs.append((i, len(outputs)))
+
+        source = cell.get("source") or ""
+        source_str = "".join(source) if isinstance(source, list) else source
+        if not source_str.strip():
+            empty_code_cells.append(i)
+
+    return CellScan(execution_counts, stored_outputs, empty_code_cells)
 
 
 def pytest_generate_tests(metafunc):
@@ -22,16 +59,19 @@ def pytest_generate_tests(metafunc):
         metafunc.parametrize("notebook_path,relative_path", all_notebooks)
 
 
-def test_no_execution_counts(notebook_path, relative_path):
-    """Test that notebooks have no execution counts (should be cleared)."""
-    with open(notebook_path, encoding="utf-8") as f:
-        nb = json.load(f)
+@pytest.fixture
+def cell_scan(notebook_path, parsed_notebook, notebook_cache):
+    """Get the content findings for the notebook, scanning it once per session."""
+    return notebook_cache(
+        "cell_scan",
+        notebook_path,
+        lambda: _scan_cells(parsed_notebook),
+    )
 
-    cells_with_counts = []
-    for i, cell in enumerate(nb.get("cells", [])):
-        execution_count = cell.get("execution_count")
-        if execution_count is not None:
-            cells_with_counts.append((i, execution_count))
+
+def test_no_execution_counts(cell_scan, relative_path):
+    """Test that notebooks have no execution counts (should be cleared)."""
+    cells_with_counts = cell_scan.execution_counts
 
     if cells_with_counts:
         error_msg = (
@@ -42,26 +82,12 @@ def test_no_execution_counts(notebook_path, relative_path):
         pytest.fail(error_msg)
 
 
-def test_no_stored_outputs(notebook_path, relative_path):
+def test_no_stored_outputs(cell_scan, relative_path):
     """Test that notebooks have no stored outputs (should be cleared).
 
     Cells with 'keep_output' tag in metadata are ignored.
     """
-    with open(notebook_path, encoding="utf-8") as f:
-        nb = json.load(f)
-
-    cells_with_outputs = []
-    for i, cell in enumerate(nb.get("cells", [])):
-        if cell.get("cell_type") == "code":
-            # Check if cell has keep_output tag
-            metadata = cell.get("metadata", {})
-            tags = metadata.get("tags", [])
-            if "keep_output" in tags:
-                continue
-
-            outputs = cell.get("outputs", [])
-            if len(outputs) > 0:
-                cells_with_outputs.append((i, len(outputs)))
+    cells_with_outputs = cell_scan.stored_outputs
 
     if cells_with_outputs:
         error_msg = (
@@ -72,23 +98,22 @@ def test_no_stored_outputs(notebook_path, relative_path):
         pytest.fail(error_msg)
 
 
-def test_no_empty_code_cells(notebook_path, relative_path):
+def test_no_empty_code_cells(cell_scan, relative_path):
     """Test that notebooks have no empty code cells."""
-    with open(notebook_path, encoding="utf-8") as f:
-        nb = json.load(f)
-
-    empty_cells = []
-    for i, cell in enumerate(nb.get("cells", [])):
-        if cell.get("cell_type") == "code":
-            source = cell.get("source", [])
-            if isinstance(source, list):
-                source_str = "".join(source)
-            else:
-                source_str = source or ""
-
-            if not source_str.strip():
-                empty_cells.append(i)
+    empty_cells = cell_scan.empty_code_cells
 
     if empty_cells:
         error_msg = f"Notebook {relative_path} has empty code cells: {empty_cells}"
         pytest.fail(error_msg)
+
+
+def test_scan_accepts_nbformat_nan(parse_notebook, tmp_path):
+    """Test that NaN metadata written by nbformat parses and scans cleanly."""
+    nb = new_notebook(cells=[new_code_cell("x = 1")], metadata={"score": math.nan})
+    path = tmp_path / "nan.ipynb"
+    path.write_text(writes(nb), encoding="utf-8")
+
+    parsed = parse_notebook(path)
+    assert math.isnan(parsed["metadata"]["score"])
+    assert parse_notebook(path) is parsed
+    assert _scan_cells(parsed) == CellScan([], [], [])
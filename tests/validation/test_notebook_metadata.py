@@ -9,10 +9,25 @@ Tests that validate notebook metadata consistency and quality:
 - Logical cell ordering
 """
 
-import json
-
 import pytest
 
+_ENV_SPECIFIC_METADATA_KEYS = (
+    "execution",
+    "executor",
+    "interpreter",
+    "vscode",
+    "colab",
+    "kaggle",
+    "widgets",
+)
+_CORE_METADATA_KEYS = frozenset({"kernelspec", "language_info"})
+_REQUIRED_SECTION_KEYWORDS = (
+    "import",
+    "setup",
+    "install",
+)
+_VALID_FIRST_CELL_TYPES = frozenset({"markdown", "code"})
+
 
 def pytest_generate_tests(metafunc):
     """Generate test parameters from all notebooks."""
@@ -24,15 +39,14 @@ def pytest_generate_tests(metafunc):
         metafunc.parametrize("notebook_path,relative_path", all_notebooks)
 
 
-def test_kernelspec_consistency(all_notebooks):
+def test_kernelspec_consistency(all_notebooks, parse_notebook):
     """Test that all notebooks have consistent kernelspec.name."""
     if not all_notebooks:
         pytest.skip("No notebooks found")
 
     kernelspecs = []
     for notebook_path, relative_path in all_notebooks:
-        with open(notebook_path, encoding="utf-8") as f:
-            nb = json.load(f)
+        nb = parse_notebook(notebook_path)
 
         kernelspec = nb.get("metadata", {}).get("kernelspec", {})
         kernelspec_name = kernelspec.get("name")
@@ -56,27 +70,10 @@ def test_kernelspec_consistency(all_notebooks):
         pytest.fail(error_msg)
 
 
-def test_no_environment_specific_metadata(notebook_path, relative_path):
+def test_no_environment_specific_metadata(parsed_notebook, relative_path):
     """Test that notebooks don't contain environment-specific metadata."""
-    env_specific_keys = [
-        "execution",
-        "executor",
-        "interpreter",
-        "vscode",
-        "colab",
-        "kaggle",
-        "widgets",
-    ]
-
-    with open(notebook_path, encoding="utf-8") as f:
-        nb = json.load(f)
-
-    metadata = nb.get("metadata", {})
-    found_keys = []
-
-    for key in env_specific_keys:
-        if key in metadata:
-            found_keys.append(key)
+    metadata = parsed_notebook.get("metadata", {})
+    found_keys = [key for key in _ENV_SPECIFIC_METADATA_KEYS if key in metadata]
 
     if found_keys:
         pytest.fail(
@@ -84,28 +81,25 @@ def test_no_environment_specific_metadata(notebook_path, relative_path):
         )
 
 
-def test_standardized_metadata_schema(all_notebooks):
+def test_standardized_metadata_schema(all_notebooks, parse_notebook):
     """Test that all notebooks follow a standardized metadata schema."""
     if not all_notebooks:
         pytest.skip("No notebooks found")
 
     # Load first notebook to establish schema
     first_path, first_relative = all_notebooks[0]
-    with open(first_path, encoding="utf-8") as f:
-        first_nb = json.load(f)
+    first_nb = parse_notebook(first_path)
     first_metadata_keys = set(first_nb.get("metadata", {}).keys())
 
     # Core metadata keys that should be consistent
-    core_keys = {"kernelspec", "language_info"}
-    first_core = first_metadata_keys & core_keys
+    first_core = first_metadata_keys & _CORE_METADATA_KEYS
 
     inconsistent = []
     for notebook_path, relative_path in all_notebooks[1:]:
-        with open(notebook_path, encoding="utf-8") as f:
-            nb = json.load(f)
+        nb = parse_notebook(notebook_path)
 
         metadata_keys = set(nb.get("metadata", {}).keys())
-        current_core = metadata_keys & core_keys
+        current_core = metadata_keys & _CORE_METADATA_KEYS
 
         if first_core != current_core:
             inconsistent.append((relative_path, current_core, first_core))
@@ -117,20 +111,11 @@ def test_standardized_metadata_schema(all_notebooks):
         pytest.fail(error_msg)
 
 
-def test_required_sections_exist(notebook_path, relative_path):
+def test_required_sections_exist(parsed_notebook, relative_path):
     """Test that notebooks contain required documentation sections."""
-    required_keywords = [
-        "import",
-        "setup",
-        "install",
-    ]
-
-    with open(notebook_path, encoding="utf-8") as f:
-        nb = json.load(f)
-
     # Collect all markdown cell content
     markdown_content = []
-    for cell in nb.get("cells", []):
+    for cell in parsed_notebook.get("cells", []):
         if cell.get("cell_type") == "markdown":
             source = cell.get("source", [])
             if isinstance(source, list):
@@ -142,7 +127,7 @@ def test_required_sections_exist(notebook_path, relative_path):
 
     # Check for at least one required keyword
     found_keywords = [
-        keyword for keyword in required_keywords if keyword in content_lower
+        keyword for keyword in _REQUIRED_SECTION_KEYWORDS if keyword in content_lower
     ]
 
     # At minimum, should have import or install/setup
@@ -152,20 +137,15 @@ def test_required_sections_exist(notebook_path, relative_path):
         )
 
 
-def test_cell_type_ordering(notebook_path, relative_path):
+def test_cell_type_ordering(parsed_notebook, relative_path):
     """Test that notebooks have logical ordering of cells."""
-    with open(notebook_path, encoding="utf-8") as f:
-        nb = json.load(f)
-
-    cells = nb.get("cells", [])
+    cells = parsed_notebook.get("cells", [])
     if len(cells) < 2:
         pytest.skip(f"Notebook {relative_path} has fewer than 2 cells")
 
     # First cell should typically be markdown (title/overview)
     first_cell_type = cells[0].get("cell_type")
-    valid_first_types = ["markdown", "code"]
-
-    if first_cell_type not in valid_first_types:
+    if first_cell_type not in _VALID_FIRST_CELL_TYPES:
         pytest.fail(
             f"Notebook {relative_path} first cell has unexpected type: {first_cell_type}"
         )
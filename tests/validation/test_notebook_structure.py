@@ -11,11 +11,15 @@ Tests that validate basic notebook file structure:
 """
 
 import json
+import math
 
 import pytest
-from nbformat import read, validate
+from nbformat import validate, writes
+from nbformat.v4 import new_code_cell, new_notebook
 from nbformat.validator import ValidationError
 
+_VALID_CELL_TYPES = frozenset({"code", "markdown", "raw"})
+
 
 def pytest_generate_tests(metafunc):
     """Generate test parameters from all notebooks."""
@@ -27,44 +31,48 @@ def pytest_generate_tests(metafunc):
         metafunc.parametrize("notebook_path,relative_path", all_notebooks)
 
 
-def test_notebook_is_valid_json(notebook_path, relative_path):
+def test_notebook_is_valid_json(notebook_bytes, relative_path, json_parser):
     """Test that notebook is valid JSON."""
     try:
-        with open(notebook_path, encoding="utf-8") as f:
-            json.load(f)
+        json_parser.loads(notebook_bytes)
     except json.JSONDecodeError as e:
         pytest.fail(f"Notebook {relative_path} is not valid JSON: {e}")
 
 
-def test_notebook_structure(notebook_path, relative_path):
+def test_json_parser_accepts_nbformat_nan(json_parser):
+    """Test that NaN metadata written by nbformat still parses as JSON."""
+    nb = new_notebook(cells=[new_code_cell("x = 1")], metadata={"score": math.nan})
+    raw = writes(nb).encode("utf-8")
+    assert b"NaN" in raw
+
+    parsed = json_parser.loads(raw)
+    assert math.isnan(parsed["metadata"]["score"])
+
+
+def test_notebook_structure(notebook_node, relative_path):
     """Test that notebook has valid nbformat structure."""
     try:
-        nb = read(str(notebook_path), as_version=4)
-        validate(nb)
+        validate(notebook_node)
     except ValidationError as e:
         pytest.fail(f"Notebook {relative_path} has invalid structure: {e}")
-    except Exception as e:
-        pytest.fail(f"Error reading notebook {relative_path}: {e}")
 
 
-def test_notebook_has_cells(notebook_path, relative_path):
+def test_notebook_has_cells(notebook_node, relative_path):
     """Test that notebook contains at least one cell."""
-    nb = read(str(notebook_path), as_version=4)
-    assert len(nb.cells) > 0, f"Notebook {relative_path} has no cells"
+    assert len(notebook_node.cells) > 0, f"Notebook {relative_path} has no cells"
 
 
-def test_notebook_metadata_exists(notebook_path, relative_path):
+def test_notebook_metadata_exists(notebook_node, relative_path):
     """Test that notebook has metadata."""
-    nb = read(str(notebook_path), as_version=4)
-    assert nb.metadata is not None, f"Notebook {relative_path} has no metadata"
+    assert notebook_node.metadata is not None, (
+        f"Notebook {relative_path} has no metadata"
+    )
 
 
-def test_notebook_no_execution_errors(notebook_path, relative_path):
+def test_notebook_no_execution_errors(notebook_node, relative_path):
     """Test that notebook cells don't contain execution errors in outputs."""
-    nb = read(str(notebook_path), as_version=4)
-
     errors = []
-    for i, cell in enumerate(nb.cells):
+    for i, cell in enumerate(notebook_node.cells):
         if cell.cell_type == "code" and hasattr(cell, "outputs"):
             for output in cell.outputs:
                 if output.get("output_type") == "error":
@@ -84,15 +92,12 @@ def test_notebook_no_execution_errors(notebook_path, relative_path):
         pytest.fail(error_msg)
 
 
-def test_notebook_cells_have_valid_types(notebook_path, relative_path):
+def test_notebook_cells_have_valid_types(notebook_node, relative_path):
     """Test that all cells have valid cell types."""
-    nb = read(str(notebook_path), as_version=4)
-
-    valid_cell_types = {"code", "markdown", "raw"}
     invalid_cells = []
 
-    for i, cell in enumerate(nb.cells):
-        if cell.cell_type not in valid_cell_types:
+    for i, cell in enumerate(notebook_node.cells):
+        if cell.cell_type not in _VALID_CELL_TYPES:
             invalid_cells.append((i, cell.cell_type))
 
     if invalid_cells:
@@ -106,3 +111,25 @@ def test_all_notebooks_found(all_notebooks):
     """Test that we found at least one notebook to test."""
     assert len(all_notebooks) > 0, "No notebooks found in examples directory"
     print(f"\nFound {len(all_notebooks)} notebooks to validate")
+
+
+def test_notebook_tests_grouped_for_xdist(request):
+    """Test that every notebook-parametrized test carries its xdist group."""
+    if not request.config.pluginmanager.hasplugin("xdist"):
+        pytest.skip("pytest-xdist is not available")
+
+    ungrouped = []
+    for item in request.session.items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or "relative_path" not in callspec.params:
+            continue
+        expected = str(callspec.params["relative_path"])
+        names = [m.kwargs.get("name") for m in item.iter_markers("xdist_group")]
+        if expected not in names:
+            ungrouped.append(item.nodeid)
+
+    if ungrouped:
+        error_msg = "Tests missing their notebook's xdist_group marker:\n"
+        for nodeid in ungrouped:
+            error_msg += f"  {nodeid}\n"
+        pytest.fail(error_msg)
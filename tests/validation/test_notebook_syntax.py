@@ -9,7 +9,6 @@ Tests that validate Python code syntax in notebooks:
 """
 
 import ast
-import json
 import tokenize
 from io import StringIO
 
@@ -26,33 +25,31 @@ def pytest_generate_tests(metafunc):
         metafunc.parametrize("notebook_path,relative_path", all_notebooks)
 
 
-def test_imports_are_parseable(notebook_path, relative_path):
-    """Test that all import statements in notebooks are parseable."""
-    with open(notebook_path, encoding="utf-8") as f:
-        nb = json.load(f)
+def _has_shell_or_magic(source_str):
+    """Check whether any line of a cell is a shell or magic command."""
+    return any(
+        line.strip().startswith("!") or line.strip().startswith("%")
+        for line in source_str.split("\n")
+    )
 
-    for i, cell in enumerate(nb.get("cells", [])):
-        if cell.get("cell_type") != "code":
-            continue
 
-        source = cell.get("source", [])
-        if isinstance(source, list):
-            source_str = "".join(source)
-        else:
-            source_str = source or ""
+@pytest.fixture
+def python_cell_sources(notebook_path, code_cell_sources, notebook_cache):
+    """Get non-empty code cells that contain no shell or magic commands."""
+    return notebook_cache(
+        "python_cell_sources",
+        notebook_path,
+        lambda: tuple(
+            (i, source_str)
+            for i, source_str in code_cell_sources
+            if source_str.strip() and not _has_shell_or_magic(source_str)
+        ),
+    )
 
-        if not source_str.strip():
-            continue
-
-        # Skip shell commands and magic commands
-        lines = source_str.split("\n")
-        has_shell_or_magic = any(
-            line.strip().startswith("!") or line.strip().startswith("%")
-            for line in lines
-        )
-        if has_shell_or_magic:
-            continue
 
+def test_imports_are_parseable(python_cell_sources, relative_path):
+    """Test that all import statements in notebooks are parseable."""
+    for i, source_str in python_cell_sources:
         try:
             ast.parse(source_str)
         except SyntaxError as e:
@@ -62,33 +59,9 @@ def test_imports_are_parseable(notebook_path, relative_path):
             )
 
 
-def test_import_statements_are_well_formed(notebook_path, relative_path):
+def test_import_statements_are_well_formed(python_cell_sources, relative_path):
     """Test that import statements are well-formed."""
-    with open(notebook_path, encoding="utf-8") as f:
-        nb = json.load(f)
-
-    for i, cell in enumerate(nb.get("cells", [])):
-        if cell.get("cell_type") != "code":
-            continue
-
-        source = cell.get("source", [])
-        if isinstance(source, list):
-            source_str = "".join(source)
-        else:
-            source_str = source or ""
-
-        if not source_str.strip():
-            continue
-
-        # Skip shell commands and magic commands
-        lines = source_str.split("\n")
-        has_shell_or_magic = any(
-            line.strip().startswith("!") or line.strip().startswith("%")
-            for line in lines
-        )
-        if has_shell_or_magic:
-            continue
-
+    for i, source_str in python_cell_sources:
         try:
             tree = ast.parse(source_str)
             # Check all import nodes are well-formed
@@ -107,75 +80,30 @@ def test_import_statements_are_well_formed(notebook_path, relative_path):
             pytest.fail(f"Notebook {relative_path} cell {i} has malformed import: {e}")
 
 
-def test_no_obvious_import_errors(notebook_path, relative_path):
+def test_no_obvious_import_errors(python_cell_sources, relative_path):
     """Test that there are no obvious import errors in syntax."""
-    with open(notebook_path, encoding="utf-8") as f:
-        nb = json.load(f)
-
-    for i, cell in enumerate(nb.get("cells", [])):
-        if cell.get("cell_type") != "code":
-            continue
-
-        source = cell.get("source", [])
-        if isinstance(source, list):
-            source_str = "".join(source)
-        else:
-            source_str = source or ""
-
-        if not source_str.strip():
-            continue
-
-        # Skip shell commands and magic commands
-        lines = source_str.split("\n")
-        has_shell_or_magic = any(
-            line.strip().startswith("!") or line.strip().startswith("%")
-            for line in lines
+    for i, source_str in python_cell_sources:
+        # Only cells containing import statements are checked here
+        has_import = any(
+            line.strip().startswith(("import ", "from "))
+            for line in source_str.split("\n")
         )
-        if has_shell_or_magic:
+        if not has_import:
             continue
 
-        # Check for common import errors
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-            # Check for incomplete imports
-            if stripped.startswith("import ") or stripped.startswith("from "):
-                # Verify it's part of valid Python by parsing the whole cell
-                try:
-                    ast.parse(source_str)
-                except SyntaxError as e:
-                    pytest.fail(
-                        f"Notebook {relative_path} cell {i} line {line_num} has import error: {e}\n"
-                        f"Line: {stripped}"
-                    )
-
-
-def test_code_cells_are_tokenizable(notebook_path, relative_path):
-    """Test that code cells can be tokenized (basic syntax check)."""
-    with open(notebook_path, encoding="utf-8") as f:
-        nb = json.load(f)
-
-    for i, cell in enumerate(nb.get("cells", [])):
-        if cell.get("cell_type") != "code":
-            continue
-
-        source = cell.get("source", [])
-        if isinstance(source, list):
-            source_str = "".join(source)
-        else:
-            source_str = source or ""
-
-        if not source_str.strip():
-            continue
+        # Parse the whole cell once; handles multi-line imports correctly
+        try:
+            ast.parse(source_str)
+        except SyntaxError as e:
+            pytest.fail(
+                f"Notebook {relative_path} cell {i} line {e.lineno} has import error: {e}\n"
+                f"Line: {(e.text or '').strip()}"
+            )
 
-        # Skip shell commands and magic commands
-        lines = source_str.split("\n")
-        has_shell_or_magic = any(
-            line.strip().startswith("!") or line.strip().startswith("%")
-            for line in lines
-        )
-        if has_shell_or_magic:
-            continue
 
+def test_code_cells_are_tokenizable(python_cell_sources, relative_path):
+    """Test that code cells can be tokenized (basic syntax check)."""
+    for i, source_str in python_cell_sources:
         try:
             # Try to tokenize
             list(tokenize.generate_tokens(StringIO(source_str).readline))